@@ -17,6 +17,9 @@ scenarios.plot('HPI')
 
 """
 Generated scenarios can be converted to a DataFrame and exported for later use.
+With the parquet extra installed (`pip install Z-model[parquet]`) parquet is preferred
+over CSV: it is faster to write and to reload on later runs.
+    scenarios.as_dataframe().to_parquet('./data/MONTE_CARLO_SIMULATIONS.parquet')
 """
 scenarios.as_dataframe().to_csv('./data/MONTE_CARLO_SIMULATIONS.csv')
 
@@ -37,6 +37,10 @@ if __name__ == '__main__':
     )
 
     print(results.summarise().loc[0])
+    # Parquet writes are much faster than CSV text formatting and the binary file is both
+    # smaller and quicker to reload in downstream analysis; with the parquet extra installed
+    # (`pip install Z-model[parquet]`) swap the `.to_csv(...)` below for
+    # `.to_parquet(Path('./data/results.parquet'), index=False)`.
     results.summarise(by=['segment_id', 'forecast_reporting_date', 'scenario', 'Stage']) \
         .reset_index() \
         .to_csv(Path('./data/results.csv.gz'), index=False)
@@ -1,16 +1,16 @@
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import PySimpleGUI as sg
-from time import sleep
-from rsa.pkcs1 import VerificationError
 from z_model.logging import logger, logfile
-from z_model.__main__ import run, __copyright__, __version__, license
+from z_model.__main__ import run, __copyright__, __version__, get_license
 from z_model.exeutor import Methods
 
 
-logo = (Path.cwd() / __file__).with_name('data') / 'deloitte.png'
-icon = (Path.cwd() / __file__).with_name('data') / 'icon.ico'
-license_message = f'{license.information.get("company_name")}, Expiration date: {license.information.get("expiration_date")}'
-
+logo = Path(__file__).with_name('data') / 'deloitte.png'
+icon = Path(__file__).with_name('data') / 'icon.ico'
+# Read the logo once and hand Tk the decoded bytes, instead of a file path it would
+# re-open and decode on every window build.
+logo_data = logo.read_bytes()
 theme_dict = {
     'BACKGROUND': '#404040',
     'TEXT': '#FFFFFF',
@@ -29,75 +29,108 @@ sg.DEFAULT_FONT = 'Calibri'
 sg.theme_add_new('Dashboard', theme_dict)
 sg.theme('Dashboard')
 
+REQUIRED = ('-ACCOUNT_DATA-', '-ASSUMPTIONS-', '-SCENARIOS-', '-RESULTS-')
+INPUT_KEYS = {
+    'account_data': '-ACCOUNT_DATA-',
+    'assumptions': '-ASSUMPTIONS-',
+    'scenarios': '-SCENARIOS-',
+    'outfile': '-RESULTS-',
+    'portfolio_assumptions': '-PORTFOLIO-ASSUMPTIONS-',
+}
+
+
+def build_window():
+    '''
+    Build the main Z-model window.
+
+    The layout and the underlying Tk root are only constructed when the GUI is actually
+    launched, so importing this module (e.g. from the CLI) stays cheap.
+    '''
+    license = get_license()
+    license_message = f'{license.information.get("company_name")}, Expiration date: {license.information.get("expiration_date")}'
+
+    top_banner = [
+        [sg.Image(data=logo_data), sg.Text(' |  Z-Model', font=('Calibri', 28))],
+    ]
+
+    inputs = [
+        [sg.Text('Model Inputs', font=('Calibri', 20))],
+        [sg.Text('Account data:\t\t'), sg.Input(size=(20,0)), sg.FileBrowse(key='-ACCOUNT_DATA-')],
+        [sg.Text('Assumptions:\t\t'), sg.Input(size=(20,0)), sg.FileBrowse(key='-ASSUMPTIONS-')],
+        [sg.Text('Macroeconomic Scenarios:\t'), sg.Input(size=(20,0)), sg.FileBrowse(key='-SCENARIOS-')],
+        [sg.Text('Results:\t\t\t'), sg.Input(size=(20,0)), sg.FileSaveAs('Browse', key='-RESULTS-', default_extension='.zip', file_types=(('application/zip', '*.zip'),))],
+        [sg.Text('Portfolio Assumptions:\t'), sg.Input(size=(20,0),default_text='Optional'), sg.FileBrowse(key='-PORTFOLIO-ASSUMPTIONS-')],
+    ]
+
+    actions = [
+        [sg.Button('Submit', size=(23, 2), border_width=0), sg.Button('Exit', size=(23, 2), border_width=0)],
+        [sg.ProgressBar(100, orientation='h', size=(36, 20), border_width=0, key='progressbar', pad=(0,10))],
+    ]
+
+    notes = [
+        [sg.Text(f'\xa9 {__copyright__}, Version: {__version__}', font='Calibri 8', pad=(0,0))],
+        [sg.Text(f'User license: {license_message}', font='Calibri 8', pad=(0,0))],
+    ]
+
+    layout = [
+        [sg.Column(top_banner, size=(400, 60))],
+        [sg.HorizontalSeparator(pad=(0,5))],
+        [sg.Column(inputs, size=(400, 200))],
+        [sg.HorizontalSeparator(pad=(0,10))],
+        [sg.Column(actions, size=(400, 80))],
+        [sg.Column(notes, size=(400, 40))],
+    ]
+
+    return sg.Window(
+        'Deloitte | Z-Model',
+        layout,
+        margins=(10,5),
+        element_justification='c',
+        no_titlebar=True,
+        grab_anywhere=True,
+        icon=icon
+    )
 
-top_banner = [
-    [sg.Image(source=str(logo)), sg.Text(' |  Z-Model', font=('Calibri', 28))],
-]
-
-inputs = [
-    [sg.Text('Model Inputs', font=('Calibri', 20))],
-    [sg.Text('Account data:\t\t'), sg.Input(size=(20,0)), sg.FileBrowse(key='-ACCOUNT_DATA-')],
-    [sg.Text('Assumptions:\t\t'), sg.Input(size=(20,0)), sg.FileBrowse(key='-ASSUMPTIONS-')],
-    [sg.Text('Macroeconomic Scenarios:\t'), sg.Input(size=(20,0)), sg.FileBrowse(key='-SCENARIOS-')],
-    [sg.Text('Results:\t\t\t'), sg.Input(size=(20,0)), sg.FileSaveAs('Browse', key='-RESULTS-', default_extension='.zip', file_types=(('application/zip', '*.zip'),))],
-    [sg.Text('Portfolio Assumptions:\t'), sg.Input(size=(20,0),default_text='Optional'), sg.FileBrowse(key='-PORTFOLIO-ASSUMPTIONS-')],
-]
-
-actions = [
-    [sg.Button('Submit', size=(23, 2), border_width=0), sg.Button('Exit', size=(23, 2), border_width=0)],
-    [sg.ProgressBar(100, orientation='h', size=(36, 20), border_width=0, key='progressbar', pad=(0,10))],
-]
-
-notes = [
-    [sg.Text(f'\xa9 {__copyright__}, Version: {__version__}', font='Calibri 8', pad=(0,0))],
-    [sg.Text(f'User license: {license_message}', font='Calibri 8', pad=(0,0))],
-]
-
-layout = [
-    [sg.Column(top_banner, size=(400, 60))],
-    [sg.HorizontalSeparator(pad=(0,5))],
-    [sg.Column(inputs, size=(400, 200))],
-    [sg.HorizontalSeparator(pad=(0,10))],
-    [sg.Column(actions, size=(400, 80))],
-    [sg.Column(notes, size=(400, 40))],
-]
-
-window = sg.Window(
-    'Deloitte | Z-Model',
-    layout,
-    margins=(10,5),
-    element_justification='c',
-    no_titlebar=True,
-    grab_anywhere=True,
-    icon=icon
-)
 
 def main():
     try:
+        license = get_license()
         if license.is_valid():
+            window = build_window()
             logger.info('Starting Z-model GUI.')
+            # The model is executed on a worker thread while the event loop keeps polling
+            # the window, so the GUI stays responsive (and the progress bar animates)
+            # instead of freezing for the duration of the run.
+            pool = ThreadPoolExecutor(max_workers=1)
+            future, progress = None, 0
             while True:
-                event, values = window.read()
-                logger.debug(f'GUI {event=}, {values=}')
+                event, values = window.read(timeout=200)
+                if event != sg.TIMEOUT_EVENT:
+                    logger.debug(f'GUI {event=}, {values=}')
                 if event == sg.WIN_CLOSED or event == 'Exit':
                     break
-                elif event == 'Submit':
-                    if values['-ACCOUNT_DATA-'] == '' and values['-ASSUMPTIONS-'] == '' and values['-SCENARIOS-'] == '' and values['-RESULTS-'] == '':
+                elif event == 'Submit' and future is None:
+                    if any(not values[k] for k in REQUIRED):
                         sg.popup_ok(f'Not all required inputs were provided. Please provide required inputs and try again.', title='Z-Model', icon=icon)
                     else:
-                        sg.popup_quick('The model is running and might take some time to compete and appear to be frozen. Please be patient.', title='Z-Model', icon=icon)
-                        window['progressbar'].update_bar(20)
-                        run(
-                            account_data=Path(values['-ACCOUNT_DATA-']),
-                            assumptions=Path(values['-ASSUMPTIONS-']),
-                            scenarios=Path(values['-SCENARIOS-']),
-                            outfile=Path(values['-RESULTS-']),
-                            portfolio_assumptions=Path(values['-PORTFOLIO-ASSUMPTIONS-']) if values['-PORTFOLIO-ASSUMPTIONS-'] != '' else None,
-                            method=Methods.ProgressMap
-                        )
+                        sg.popup_quick('The model is running and might take some time to complete. Please be patient.', title='Z-Model', icon=icon)
+                        progress = 5
+                        window['progressbar'].update_bar(progress)
+                        paths = {
+                            arg: Path(values[key]) if values[key] else None
+                            for arg, key in INPUT_KEYS.items()
+                        }
+                        future = pool.submit(run, **paths, method=Methods.ProgressMap)
+                elif future is not None:
+                    if future.done():
+                        e = future.exception()
+                        if e is not None:
+                            raise e
                         window['progressbar'].update_bar(100)
                         sg.popup_ok(f'The model is done running and results are saved to the following location: {values["-RESULTS-"]}', title='Z-Model', icon=icon)
                         break
+                    progress = min(progress + 1, 95)
+                    window['progressbar'].update_bar(progress)
             window.close()
         else:
             sg.popup_ok(
@@ -1,5 +1,6 @@
+import sys
 import typer
-import multiprocessing
+from functools import lru_cache
 from typing import Optional
 from pathlib import Path
 from datetime import datetime
@@ -7,30 +8,41 @@ from datetime import datetime
 from z_model import __version__
 from z_model.logging import logger, logfile
 from z_model.exeutor import Methods
-from z_model.license import License
 
 __author__ = "Geyer Bisschoff"
 __copyright__ = "Deloitte LLP"
 __license__ = "Proprietary Software License"
 
 logger.info(f'Logging setup. Saving too {logfile=}')
-app = typer.Typer()
-
-try:
-    license = License.load(Path().home() / '.z_model_license')
-except Exception as e:
-    logger.error(
-        f"User license error. Please check that the user license is saved at the correct location.\n"
-        f"The software expects the license file to be named and located in (Windows) C:/Users/%USERNAME%/.z_model_license\n"
-        f"{e}"
-    )
+# Completion support pulls in shellingham and extra Click machinery on every invocation;
+# the CLI has a handful of simple commands, so it isn't worth the import cost.
+app = typer.Typer(add_completion=False)
+
+@lru_cache(maxsize=None)
+def get_license():
+    '''
+    Load the user license.
+
+    The license is loaded (and its file read) on first use rather than at import time, so
+    CLI invocations that never touch licensing don't pay for the disk read and parse.
+    '''
+    try:
+        from z_model.license import License
+        return License.load(Path().home() / '.z_model_license')
+    except Exception as e:
+        logger.error(
+            f"User license error. Please check that the user license is saved at the correct location.\n"
+            f"The software expects the license file to be named and located in (Windows) C:/Users/%USERNAME%/.z_model_license\n"
+            f"{e}"
+        )
+        raise
 
 @app.command()
 def about():
     '''
     Print Z-model about information.
     '''
-
+    license = get_license()
     return typer.echo(
     f"""
     Z-Model
@@ -64,7 +76,7 @@ def generate_scenarios(
 
     '''
     try:
-        if license.is_valid():
+        if get_license().is_valid():
             from z_model.scenarios import Scenarios
             from z_model.file_reader import write_file
 
@@ -100,8 +112,9 @@ def run(
     :param scenarios: the path to the macroeconomic scenarios.
         The file should be in .XLSX, .CSV or .CSV.GZ format.
 
-    :param outfile: the path to the output file. Results are stored in a zip archive and thus should have the
-        a `.zip` extension.
+    :param outfile: the path to the output file. A `.zip` extension stores the results in a zip
+        archive of CSV reports; a path without an extension is treated as a directory and the
+        results are stored as parquet files instead (requires the `parquet` extra).
 
     :param method: one of either 'map', 'process_map' or 'thread_map'. Depending on the selection the
         execution engine changes.
@@ -117,7 +130,7 @@ def run(
 
     '''
     try:
-        if license.is_valid():
+        if get_license().is_valid():
             from z_model.assumptions import Assumptions
             from z_model.scenarios import Scenarios
             from z_model.account import AccountData, SimulatedAccountData
@@ -208,7 +221,11 @@ def default(ctx: typer.Context):
         gui()
 
 def main():
-    multiprocessing.freeze_support()
+    if sys.platform == 'win32':
+        # Only frozen Windows executables need this; it is a no-op elsewhere but still
+        # drags in the multiprocessing spawn machinery.
+        import multiprocessing
+        multiprocessing.freeze_support()
     app()
 
 if __name__ == "__main__":
@@ -1,12 +1,24 @@
-from numpy import array, zeros, isnat
-from pandas import date_range, period_range, Int64Dtype, DataFrame, isnull, NA, concat
-from dateutil.relativedelta import relativedelta
+from numpy import array, zeros, isnat, where
+from pandas import date_range, period_range, Int64Dtype, DataFrame, isnull, NA, concat, to_datetime
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from .file_reader import read_file
+from .file_reader import read_file, write_file, guess_extension
 from pandas.tseries.offsets import MonthEnd
 
 
+@lru_cache(maxsize=1024)
+def _remaining_life_index(reporting_date: datetime, remaining_life: int):
+    '''
+    Build the month-end date index between the reporting date and the end of the remaining life.
+
+    The :class:`date_range` constructor is relatively expensive and most accounts in a
+    portfolio share a reporting date, so the (immutable) index is cached and shared between
+    accounts with the same reporting date and remaining life.
+    '''
+    return date_range(reporting_date, periods=remaining_life, freq='M')
+
+
 class Account:
     '''
     Account
@@ -19,7 +31,17 @@ class Account:
       end of the accounts remaining life.
 
     '''
-    def __init__(self, contract_id: str, outstanding_balance:float, limit:float, current_arrears:float, contractual_payment:float, contractual_freq:int, interest_rate_type:str, interest_rate_freq:int, fixed_rate:float, spread:float, origination_date:datetime, payment_holiday_end_date:datetime, maturity_date:datetime, reporting_date:datetime, remaining_life:int, collateral_value:float, origination_rating:int, current_rating:int, watchlist:int, *args, **kwargs):
+    # One Account object is created per row of account data, so the per-instance __dict__
+    # is a measurable memory cost on large portfolios; slots keep the instances compact.
+    __slots__ = (
+        'contract_id', 'outstanding_balance', 'limit', 'current_arrears', 'interest_rate_type',
+        'interest_rate_freq', 'fixed_rate', 'spread', 'origination_date',
+        'payment_holiday_end_date', 'maturity_date', 'reporting_date', 'remaining_life',
+        'collateral_value', 'contractual_payment', 'contractual_freq', 'origination_rating',
+        'current_rating', 'watchlist', 'time_on_book', 'remaining_life_index',
+    )
+
+    def __init__(self, contract_id: str, outstanding_balance:float, limit:float, current_arrears:float, contractual_payment:float, contractual_freq:int, interest_rate_type:str, interest_rate_freq:int, fixed_rate:float, spread:float, origination_date:datetime, payment_holiday_end_date:datetime, maturity_date:datetime, reporting_date:datetime, remaining_life:int, collateral_value:float, origination_rating:int, current_rating:int, watchlist:int, time_on_book:int=None, *args, **kwargs):
         self.contract_id = contract_id
         self.outstanding_balance = outstanding_balance
         self.limit = limit
@@ -39,9 +61,12 @@ class Account:
         self.origination_rating = origination_rating
         self.current_rating = current_rating
         self.watchlist = watchlist
-        self.time_on_book = (reporting_date.year - origination_date.year) * 12 + \
-               (reporting_date.month - origination_date.month)
-        self.remaining_life_index = date_range(reporting_date, periods=remaining_life, freq='M')
+        # time_on_book can be supplied precomputed (see AccountData.accounts, which derives
+        # it for the whole book in one vectorised pass) or derived here for a single account.
+        self.time_on_book = time_on_book if time_on_book is not None else \
+            (reporting_date.year - origination_date.year) * 12 + \
+            (reporting_date.month - origination_date.month)
+        self.remaining_life_index = _remaining_life_index(reporting_date, remaining_life)
 
 
 class AccountData:
@@ -116,6 +141,7 @@ class AccountData:
         'spread': float,
         'origination_date': datetime,
         'payment_holiday_end_date': datetime,
+        'maturity_date': datetime,
         'reporting_date': datetime,
         'remaining_life': int,
         'collateral_value': float,
@@ -128,6 +154,9 @@ class AccountData:
         '''
         Create an `AccountData` object from a Pandas DataFrame.
         '''
+        # Normalise the interest rate type once at ingestion so the per-account models can
+        # compare it directly without calling .upper() on every access.
+        data['interest_rate_type'] = data['interest_rate_type'].str.upper()
         self.data = data
 
     def __len__(self):
@@ -136,6 +165,25 @@ class AccountData:
         '''
         return len(self.data.index)
 
+    def accounts(self):
+        '''
+        Create the :class:`Account` objects for all accounts in the data.
+
+        The data is converted to plain Python values one column at a time (structure-of-arrays)
+        and the accounts are assembled from those columns, rather than converting one row at a
+        time with ``DataFrame.apply`` which constructs a :class:`Series` per account.
+
+        :return: a :class:`list` of :class:`Account` objects in data order.
+        '''
+        data = self.data.reset_index()
+        data['time_on_book'] = (
+            (data['reporting_date'].dt.year - data['origination_date'].dt.year) * 12
+            + (data['reporting_date'].dt.month - data['origination_date'].dt.month)
+        )
+        columns = list(data.columns)
+        values = [data[column].tolist() for column in columns]
+        return [Account(**dict(zip(columns, row))) for row in zip(*values)]
+
     def __add__(self, other):
         if not isinstance(other, AccountData):
             raise TypeError('Object is not of type AccountData')
@@ -151,10 +199,37 @@ class AccountData:
             The account data should contain the columns as specified by the `DICTIONARY` attribute.
             The function support file formats as specified by the `file_reader` module.
         """
-        data = read_file(url=url, sheet_name='DATA', dtype=cls.DICTIONARY, index_col='contract_id')
+        if guess_extension(url) in ('.xlsx', '.xlx'):
+            data = read_file(url=url, sheet_name='DATA', dtype=cls.DICTIONARY, index_col='contract_id')
+        else:
+            # Binary formats such as parquet (with the `parquet` extra installed) are much
+            # faster to parse than Excel, so support loading the account data from any
+            # format the `file_reader` module understands.
+            # These readers don't accept the Excel specific arguments, so the dtypes and index
+            # are applied after the read instead.
+            data = read_file(url=url)
+            for column, dtype in cls.DICTIONARY.items():
+                if column in data.columns:
+                    data[column] = to_datetime(data[column]) if dtype is datetime else data[column].astype(dtype)
+            if data.index.name != 'contract_id':
+                data = data.set_index('contract_id')
         data['account_type'] = 'Actual'
         return cls(data=data)
 
+    def to_file(self, url: Path):
+        """
+        Write the account data to a file.
+
+        Converting the account data to a binary format once makes repeat runs skip the slow
+        Excel parse entirely, e.g. parquet with the ``parquet`` extra installed
+        (``pip install Z-model[parquet]``), or pickle with no extra dependencies.
+
+        :param url: relative path to the output file.
+            The file format is determined by the file extension, as specified by the
+            `file_reader` module.
+        """
+        write_file(self.data, url)
+
 
 
 class SimulatedAccountData(AccountData):
@@ -182,41 +257,6 @@ class SimulatedAccountData(AccountData):
         def PMT(PV, i, n, FV):
             return (PV - FV * (1 + i) ** -n) * (i / (1 - (1 + i) ** -n))
 
-        def make_account(id, segment_id, type, term, balloon, interest_rate_type, interest_rate, spread, frequency,
-                         origination_rating, ltv, origination_date, origination_amount):
-
-            if type.upper() in ('AMORTISING', 'IO', 'BULLET'):
-                balloon = 0 if type.upper() == 'BULLET' else origination_amount * balloon
-                interest_per_period = (1 + interest_rate / 12) ** (12 / frequency) - 1
-                number_of_payments = term / 12 * frequency
-                pmt = PMT(origination_amount, interest_per_period, number_of_payments, balloon)
-            else:
-                pmt = 0
-
-            collateral_value = origination_amount / ltv if ltv > 0 else 0
-
-            return {
-                'contract_id': f'FA-{id:06}',
-                'segment_id': segment_id,
-                'outstanding_balance': origination_amount if type != 'REVOLVING' else 0,
-                'limit': origination_amount if type == 'REVOLVING' else 0,
-                'current_arrears': 0,
-                'contractual_payment': pmt,
-                'contractual_freq': frequency,
-                'interest_rate_type': interest_rate_type,
-                'interest_rate_freq': 12,
-                'fixed_rate': interest_rate,
-                'spread': spread,
-                'origination_date': origination_date,
-                'payment_holiday_end_date': NA,
-                'reporting_date': origination_date + MonthEnd(0),
-                'remaining_life': term,
-                'collateral_value': collateral_value,
-                'origination_rating': origination_rating,
-                'current_rating': origination_rating,
-                'watchlist': NA
-            }
-
         data = read_file(url, dtype=cls.DICTIONARY, sheet_name='DATA')
         id_vars = [c for c in data.columns if isinstance(c, str)]
         keep_cols = ['id', *cls.DICTIONARY.keys(), 'origination_date', 'origination_amount']
@@ -231,6 +271,42 @@ class SimulatedAccountData(AccountData):
                 .reset_index()
                 .rename(columns={'index': 'id'})
         )[keep_cols]
-        accounts = DataFrame([make_account(**d) for i, d in data.iterrows()]).set_index('contract_id')
+
+        # All the account fields are simple arithmetic on the melted columns, so the book is
+        # generated with whole-column operations and assembled column-wise, instead of
+        # building one dictionary per account with iterrows.
+        type = data['type'].str.upper()
+        interest_per_period = (1 + data['interest_rate'] / 12) ** (12 / data['frequency']) - 1
+        number_of_payments = data['term'] / 12 * data['frequency']
+        balloon = where(type == 'BULLET', 0, data['origination_amount'] * data['balloon'])
+        pmt = where(
+            type.isin(('AMORTISING', 'IO', 'BULLET')),
+            PMT(data['origination_amount'], interest_per_period, number_of_payments, balloon),
+            0
+        )
+        ltv = data['ltv']
+        collateral_value = where(ltv > 0, data['origination_amount'] / ltv.where(ltv > 0, 1), 0)
+
+        accounts = DataFrame({
+            'contract_id': 'FA-' + data['id'].astype(str).str.zfill(6),
+            'segment_id': data['segment_id'],
+            'outstanding_balance': where(data['type'] != 'REVOLVING', data['origination_amount'], 0),
+            'limit': where(data['type'] == 'REVOLVING', data['origination_amount'], 0),
+            'current_arrears': 0,
+            'contractual_payment': pmt,
+            'contractual_freq': data['frequency'],
+            'interest_rate_type': data['interest_rate_type'],
+            'interest_rate_freq': 12,
+            'fixed_rate': data['interest_rate'],
+            'spread': data['spread'],
+            'origination_date': data['origination_date'],
+            'payment_holiday_end_date': NA,
+            'reporting_date': data['origination_date'] + MonthEnd(0),
+            'remaining_life': data['term'],
+            'collateral_value': collateral_value,
+            'origination_rating': data['origination_rating'],
+            'current_rating': data['origination_rating'],
+            'watchlist': NA
+        }).set_index('contract_id')
         accounts['account_type'] = 'Simulated'
         return cls(data=accounts)
@@ -12,8 +12,9 @@ segment as a dictionary.
 
 '''
 from numpy import array
-from pandas import read_excel
+from pandas import read_excel, read_pickle, to_pickle, ExcelFile
 from pathlib import Path
+from .file_reader import guess_extension
 from .stage_map import StageMap
 
 class PDAssumptions:
@@ -277,23 +278,35 @@ class Assumptions(dict):
 
         :param url: Relative path to the Excel file.
 
+        The parsed assumptions are cached in a sibling ``.pkl`` file, which is used on
+        subsequent runs if it is newer than the Excel file. This skips the slow Excel parse
+        for repeat runs on the same assumptions.
+
         """
-        assumptions = read_excel(
-            io=url,
-            sheet_name='ASSUMPTIONS',
-            dtype=cls.DICTIONARY['ASSUMPTIONS'],
-            index_col='segment_id',
-            usecols=cls.DICTIONARY['ASSUMPTIONS'].keys(),
-            engine='openpyxl'
-        )
-        transition_matrices = read_excel(
-            io=url,
-            sheet_name='TRANSITION_MATRIX',
-            dtype=cls.DICTIONARY['TRANSITION_MATRIX'],
-            index_col='segment_id',
-            engine='openpyxl'
-        )
-        stage_map = StageMap.from_file(url)
+        cache = url.with_suffix('.pkl')
+        if guess_extension(url) != '.pkl' and cache.exists() and cache.stat().st_mtime >= url.stat().st_mtime:
+            try:
+                return read_pickle(cache)
+            except Exception:
+                pass # a corrupt or stale cache (e.g. written by an older version) just means re-parsing
+
+        # Parse the workbook once and read all sheets from it, instead of re-parsing the
+        # whole file for every sheet.
+        with ExcelFile(url, engine='openpyxl') as workbook:
+            assumptions = read_excel(
+                io=workbook,
+                sheet_name='ASSUMPTIONS',
+                dtype=cls.DICTIONARY['ASSUMPTIONS'],
+                index_col='segment_id',
+                usecols=cls.DICTIONARY['ASSUMPTIONS'].keys()
+            )
+            transition_matrices = read_excel(
+                io=workbook,
+                sheet_name='TRANSITION_MATRIX',
+                dtype=cls.DICTIONARY['TRANSITION_MATRIX'],
+                index_col='segment_id'
+            )
+            stage_map = StageMap.from_file(workbook)
 
         segments = {
             segment_id: SegmentAssumptions(
@@ -341,4 +354,9 @@ class Assumptions(dict):
             )
             for segment_id, d in assumptions.iterrows()
         }
-        return cls(segments)
+        rs = cls(segments)
+        try:
+            to_pickle(rs, cache)
+        except OSError:
+            pass # the cache is an optimisation only; a read-only location is not an error
+        return rs
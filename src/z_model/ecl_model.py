@@ -1,5 +1,5 @@
 from pandas import DataFrame
-from numpy import array, cumprod
+from numpy import array, cumprod, cumsum, zeros, concatenate
 from .transition_matrix import TransitionMatrix, make_monthly_matrix
 from .effective_interest_rate import EffectiveInterestRate
 from .loss_given_default import LossGivenDefault
@@ -57,31 +57,40 @@ class ECLModel:
 
         '''
         eir = self.effective_interest_rate[account]
-        df_t = cumprod(1 + eir) / (1 + eir[0])
-        df_t0 = 1 / cumprod(1 + eir)
-        pd = self.probability_of_default[account]
-        cpd_12m = pd[::-1].cumsum()[::-1]
-        pd_12m = cpd_12m - cpd_12m.shift(-12).fillna(0)
-        ead = self.exposure_at_default[account]
-        lgd = self.loss_given_default[account]
+        ead = self.exposure_at_default.values(account, eir=eir)
+        lgd = self.loss_given_default.values(account, ead=ead, eir=eir)
         stage_p = self.stage_probability[account]
 
+        # The remaining arithmetic only combines aligned vectors, so it is done on the
+        # underlying arrays; the labelled DataFrame is assembled once at the end instead of
+        # paying the pandas alignment overhead on every intermediate step.
+        n = account.remaining_life
+        eir, ead, lgd = eir.to_numpy(), ead.to_numpy(), lgd.to_numpy()
+        pd = self.probability_of_default[account].to_numpy()
+        p1, p2, p3, pwo = (stage_p[s].to_numpy() for s in (1, 2, 3, 'wo'))
+
+        cum_growth = cumprod(1 + eir)
+        df_t = cum_growth / cum_growth[0]
+        df_t0 = 1 / cum_growth
+        cpd_12m = cumsum(pd[::-1])[::-1]
+        pd_12m = cpd_12m - concatenate((cpd_12m[12:], zeros(min(12, n))))
+
         marginal_ecl = pd * ead * lgd * df_t0
         stage_3_ecl = ead * lgd
-        stage_2_ecl_t0 = marginal_ecl[::-1].cumsum()[::-1]
+        stage_2_ecl_t0 = cumsum(marginal_ecl[::-1])[::-1]
         stage_2_ecl = stage_2_ecl_t0 * df_t
-        stage_1_ecl_t0 = stage_2_ecl_t0 - stage_2_ecl_t0.shift(-12).fillna(0)
+        stage_1_ecl_t0 = stage_2_ecl_t0 - concatenate((stage_2_ecl_t0[12:], zeros(min(12, n))))
         stage_1_ecl = stage_1_ecl_t0 * df_t
 
-        exposure = ead * (stage_p[1]+stage_p[2]+stage_p[3])
+        exposure = ead * (p1 + p2 + p3)
         ecl = (
-            stage_p[1] * stage_1_ecl +
-            stage_p[2] * stage_2_ecl +
-            stage_p[3] * stage_3_ecl
+            p1 * stage_1_ecl +
+            p2 * stage_2_ecl +
+            p3 * stage_3_ecl
         )
 
         coverage_ratio = ecl / exposure
-        write_off = ead * stage_p['wo']
+        write_off = ead * pwo
 
         result = DataFrame({
             'contract_id': account.contract_id,
@@ -93,10 +102,10 @@ class ECLModel:
             'EAD(t)': ead,
             'LGD(t)': lgd,
             'DF(t)': df_t0,
-            'P(S=1)': stage_p[1],
-            'P(S=2)': stage_p[2],
-            'P(S=3)': stage_p[3],
-            'P(S=WO)': stage_p['wo'],
+            'P(S=1)': p1,
+            'P(S=2)': p2,
+            'P(S=3)': p3,
+            'P(S=WO)': pwo,
             'Marginal CR(t)':marginal_ecl,
             'STAGE1(t)':stage_1_ecl,
             'STAGE2(t)':stage_2_ecl,
@@ -9,7 +9,7 @@ There are two EIR models: :class:`FixedEffectiveInterestRate` and :class:`FloatE
 from numpy import repeat, array
 from pandas import Series
 from .account import Account
-from .scenarios import Scenario
+from .scenarios import Scenario, take
 from .assumptions import EIRAssumptions
 
 class FixedEffectiveInterestRate:
@@ -53,9 +53,10 @@ class FloatEffectiveInterestRate:
 
     def __getitem__(self, account: Account):
 
-        return (
+        return Series(
             (1 + account.spread / account.interest_rate_freq) ** (account.interest_rate_freq / 12) - 1 +
-            (1 + self.base_rate[account.remaining_life_index]) ** (1 / 12) - 1
+            (1 + take(self.base_rate, account.remaining_life_index)) ** (1 / 12) - 1,
+            index=account.remaining_life_index
         )
 
 class EffectiveInterestRate:
@@ -71,12 +72,12 @@ class EffectiveInterestRate:
         self.float_eir = float_eir
 
     def __getitem__(self, account: Account):
-        if account.interest_rate_type.upper() == 'FIXED':
+        if account.interest_rate_type == 'FIXED':
             return self.fixed_eir[account]
-        elif account.interest_rate_type.upper() == 'FLOAT':
+        elif account.interest_rate_type in ('FLOAT', 'FLOATING'):
             return self.float_eir[account]
         else:
-            return ValueError(f'Invalid interest rate type: {account.contract_id=}, {account.interest_rate_type=}')
+            raise ValueError(f'Invalid interest rate type: {account.contract_id=}, {account.interest_rate_type=}')
 
     @classmethod
     def from_assumptions(cls, assumptions: EIRAssumptions, scenario: Scenario):
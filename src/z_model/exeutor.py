@@ -1,12 +1,31 @@
-from pandas import concat, merge
-from tqdm.auto import tqdm
-from tqdm.contrib.concurrent import thread_map, process_map
+from __future__ import annotations
+from os import cpu_count
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
-from .account import Account, AccountData
-from .assumptions import Assumptions
-from .scenarios import Scenarios
-from .results import Results
-from .ecl_model import ECLModel
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .account import AccountData
+    from .assumptions import Assumptions
+    from .scenarios import Scenarios
+
+# The numeric stack (pandas and the model modules) is imported inside the functions that
+# need it, so that importing this module for the Methods enum - which the CLI does on every
+# invocation - stays cheap.
+
+_WORKER_STATE = {}
+
+def _init_worker(assumptions: Assumptions, account_data: AccountData):
+    '''
+    Store the shared read-only model inputs in the (worker) process.
+
+    When scenarios are executed in parallel the assumptions and account data are the same
+    for every scenario, so they are shipped to each worker once via the pool initializer
+    instead of being pickled into every task.
+    '''
+    _WORKER_STATE['assumptions'] = assumptions
+    _WORKER_STATE['account_data'] = account_data
+
 
 class Methods(str, Enum):
     '''
@@ -27,10 +46,11 @@ class Methods(str, Enum):
     ThreadMap = 'thread_map'
 
     def executor(self, *args, **kwargs):
+        from tqdm.auto import tqdm
+        from tqdm.contrib.concurrent import thread_map
         return {
             Methods.Map: lambda fn, x, **k: list(map(fn, tqdm(x, **k))),
             Methods.ThreadMap: thread_map,
-            Methods.ProgressMap: process_map,
         }.get(self)(*args, **kwargs)
 
 
@@ -51,9 +71,22 @@ class Executor:
         '''
         Execute a single macroeconomic scenario
 
-        :param args: Tuple(name, scenario, assumptions, account_data)
+        The assumptions and account data are read from the shared worker state set up by
+        :func:`_init_worker`.
+
+        :param args: Tuple(name, scenario, chunk, n_chunks). The accounts are strided into
+            ``n_chunks`` chunks and only chunk ``chunk`` is calculated, so a single scenario
+            can be spread over multiple workers.
         '''
-        name, scenario, assumptions, account_data = args
+        from pandas import concat
+        from .account import AccountData
+        from .ecl_model import ECLModel
+
+        name, scenario, chunk, n_chunks = args
+        assumptions = _WORKER_STATE['assumptions']
+        account_data = _WORKER_STATE['account_data']
+        if n_chunks > 1:
+            account_data = AccountData(account_data.data.iloc[chunk::n_chunks].copy())
         ecl_models = {
             segment_id: ECLModel.from_assumptions(
                 segment_assumptions=assumptions,
@@ -62,11 +95,13 @@ class Executor:
             for segment_id, assumptions in assumptions.items()
         }
 
-        data = account_data.data.reset_index()
-        data['Account()'] = data.apply(lambda x: Account(**x), axis=1)
-        data['ECLModel()'] = data['segment_id'].map(ecl_models)
-        data['ECL()'] = data.apply(lambda x: x['ECLModel()'][x['Account()']], axis=1)
-        rs = concat(data['ECL()'].values)
+        # Pair each account with its segment model directly; DataFrame.apply would build a
+        # Series per row just to fetch the two objects back out of it.
+        accounts = account_data.accounts()
+        models = account_data.data['segment_id'].map(ecl_models)
+        # The per-account frames share identical columns, so concat can lay the blocks out
+        # without re-copying each input.
+        rs = concat([model[account] for model, account in zip(models, accounts)], copy=False)
         rs['scenario'] = name
         return rs
 
@@ -80,14 +115,38 @@ class Executor:
 
         :return:  A :class:`Results` with the account level ECL and ST results for each month until maturity.
         """
-        args = [(n, s, assumptions, account_data) for n, s in scenarios.items()]
-        r = self.method.executor(self._run_scenario, args, desc='Scenarios', position=0)
+        from pandas import concat, merge
+        from tqdm.auto import tqdm
+        from .logging import logger
+        from .results import Results
+
+        if self.method is Methods.ThreadMap:
+            logger.warning(
+                'thread_map runs the CPU bound scenario calculations under the GIL and rarely '
+                'improves on map; use process_map for parallel execution.'
+            )
+
+        args = list(scenarios.items())
+        if self.method is Methods.ProgressMap:
+            # When there are fewer scenarios than cores the accounts are strided into chunks
+            # so every core still gets a (scenario, chunk) task; each worker gets a copy of
+            # the model inputs, so no more workers are spawned than there are tasks.
+            cores = cpu_count() or 1
+            n_chunks = max(1, cores // max(len(args), 1))
+            tasks = [(name, scenario, chunk, n_chunks) for name, scenario in args for chunk in range(n_chunks)]
+            workers = min(len(tasks), cores)
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(assumptions, account_data)) as pool:
+                r = list(tqdm(pool.map(self._run_scenario, tasks), total=len(tasks), desc='Scenarios', position=0))
+        else:
+            _init_worker(assumptions, account_data)
+            tasks = [(name, scenario, 0, 1) for name, scenario in args]
+            r = self.method.executor(self._run_scenario, tasks, desc='Scenarios', position=0)
 
         #Calculate weighted scenario
-        r = concat(r).reset_index().set_index(['contract_id', 'T', 'forecast_reporting_date'])
+        r = concat(r, copy=False).reset_index().set_index(['contract_id', 'T', 'forecast_reporting_date'])
         weights = scenarios.weights
         rw = sum([d.drop(columns='scenario') * weights.get(n) for n, d in r.groupby('scenario')])
         rw['scenario'] = 'Weighted'
-        rc = concat([r, rw]).reset_index()
+        rc = concat([r, rw], copy=False).reset_index()
 
         return Results(merge(account_data.data, rc, how='left', on='contract_id'))
@@ -34,9 +34,18 @@ class ConstantExposureAtDefault:
     def __init__(self, exposure_at_default: float):
         self.exposure_at_default = exposure_at_default
 
-    def __getitem__(self, account: Account):
+    def values(self, account: Account, eir: Series = None):
+        '''
+        Calculate the EAD vector for an account.
+
+        :param account: an :class:`Account` object.
+        :param eir: not used by this model.
+        '''
         return Series(account.outstanding_balance * self.exposure_at_default, index=account.remaining_life_index)
 
+    def __getitem__(self, account: Account):
+        return self.values(account)
+
 
 class BulletExposureAtDefault:
     '''
@@ -60,15 +69,20 @@ class BulletExposureAtDefault:
         self.default_penalty_pct = default_penalty_pct
         self.default_penalty_amt = default_penalty_amt
 
-    def __getitem__(self, account: Account):
+    def values(self, account: Account, eir: Series = None):
+        '''
+        Calculate the EAD vector for an account.
+
+        :param account: an :class:`Account` object.
+        :param eir: the account EIR vector, if already calculated. Avoids recalculating it.
+        '''
         balance = account.outstanding_balance
         t = arange(account.remaining_life) + 1
-        eir = self.effective_interest_rate[account]
+        eir = self.effective_interest_rate[account] if eir is None else eir
         eir_adjusted = (1 + eir) * (1 + self.fees_pct / 12) / (1 + self.prepayment_pct / 12) - 1
         df_t0 = 1 / cumprod(1 + eir_adjusted)
 
-        cf = repeat(self.fixed_fees, account.remaining_life)
-        cum_cf_t = cumsum(cf * df_t0) / df_t0
+        cum_cf_t = self.fixed_fees * cumsum(df_t0) / df_t0
 
         balance_t = maximum(balance / df_t0 + cum_cf_t, 0)
         balance_t_pfees = balance_t * (1 + self.default_penalty_pct) + self.default_penalty_amt
@@ -77,6 +91,9 @@ class BulletExposureAtDefault:
 
         return Series(ead, index=account.remaining_life_index)
 
+    def __getitem__(self, account: Account):
+        return self.values(account)
+
 
 class AmortisingExposureAtDefault:
     '''
@@ -103,10 +120,16 @@ class AmortisingExposureAtDefault:
         self.default_penalty_pct = default_penalty_pct
         self.default_penalty_amt = default_penalty_amt
 
-    def __getitem__(self, account: Account):
+    def values(self, account: Account, eir: Series = None):
+        '''
+        Calculate the EAD vector for an account.
+
+        :param account: an :class:`Account` object.
+        :param eir: the account EIR vector, if already calculated. Avoids recalculating it.
+        '''
         balance = account.outstanding_balance
         t = arange(account.remaining_life) + 1
-        eir = self.effective_interest_rate[account]
+        eir = self.effective_interest_rate[account] if eir is None else eir
         eir_adjusted = (1 + eir) * (1 + self.fees_pct / 12) / (1 + self.prepayment_pct / 12) - 1
         df_t0 = 1 / cumprod(1 + eir_adjusted)
 
@@ -126,6 +149,9 @@ class AmortisingExposureAtDefault:
 
         return Series(ead, index=account.remaining_life_index)
 
+    def __getitem__(self, account: Account):
+        return self.values(account)
+
 
 class CCFExposureAtDefault:
     '''
@@ -142,7 +168,13 @@ class CCFExposureAtDefault:
         self.ccf_method = ccf_method.upper()
         self.ccf = ccf
 
-    def __getitem__(self, account: Account):
+    def values(self, account: Account, eir: Series = None):
+        '''
+        Calculate the EAD vector for an account.
+
+        :param account: an :class:`Account` object.
+        :param eir: not used by this model.
+        '''
         if self.ccf_method.upper() == 'METHOD-1':
             return Series(
                 account.outstanding_balance * self.ccf,
@@ -161,6 +193,9 @@ class CCFExposureAtDefault:
         else:
             raise ValueError(f'CCF Method ({self.ccf_method}) not supported.')
 
+    def __getitem__(self, account: Account):
+        return self.values(account)
+
 
 class ExposureAtDefault:
     @classmethod
@@ -2,6 +2,7 @@ import json
 import os
 from base64 import b64encode, b64decode
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
 
 import rsa
@@ -12,17 +13,22 @@ from .logging import logger
 
 HASH_METHOD = 'SHA-1'
 
-try:
-    verify_key_path = (Path.cwd() / __file__).with_name('data') / 'verify.key'
-    VERIFY_KEY = PublicKey.load(verify_key_path)
-except Exception as e:
-    logger.error(e)
+@lru_cache(maxsize=1)
+def _verify_key():
+    '''
+    Load and parse the packaged RSA verification key.
+
+    The PEM is parsed once per process, on first use, rather than at import; a missing or
+    corrupt key surfaces through :meth:`License.is_valid` instead of failing the import.
+    '''
+    return PublicKey.load(Path(__file__).with_name('data') / 'verify.key')
 
 
 class License():
     def __init__(self, information: dict, signature: str):
         self.information = information
         self.signature = signature
+        self._verified = None
 
     def is_valid(self):
         try:
@@ -37,8 +43,13 @@ class License():
                 if time_remaining.days <= 30:
                     logger.warning(f'The license expires in {time_remaining.days} days on {expiration_date}.')
 
-            msg = json.dumps(self.information).encode()
-            is_valid = rsa.verify(msg, b64decode(self.signature.encode()), VERIFY_KEY) == HASH_METHOD
+            if self._verified is None:
+                # The RSA signature verification is the expensive part and its outcome can't
+                # change for a given license, so it is only performed once per process. The
+                # expiration date above is still rechecked on every call.
+                msg = json.dumps(self.information).encode()
+                self._verified = rsa.verify(msg, b64decode(self.signature.encode()), _verify_key()) == HASH_METHOD
+            is_valid = self._verified
         except Exception as e:
             logger.error(e)
             is_valid = False
@@ -17,9 +17,8 @@ Each LGD model exposes a common API to calculate the account specific LGD vector
 '''
 from numpy import repeat, array, maximum, zeros, arange
 from pandas import Series
-from dateutil.relativedelta import relativedelta
 from .account import Account
-from .scenarios import Scenario
+from .scenarios import Scenario, take
 from .effective_interest_rate import EffectiveInterestRate
 from .exposure_at_default import ExposureAtDefault
 from .assumptions import LGDAssumptions
@@ -49,9 +48,15 @@ class SecuredLossGivenDefault:
         self.index = index
 
     def __getitem__(self, account: Account):
-        ead = self.exposure_at_default[account]
-        eir = self.effecive_interest_rate[account]
-        ci = self.index.shift(-self.time_to_sale)[account.remaining_life_index] / self.index[account.reporting_date]
+        return self.values(account)
+
+    def values(self, account: Account, ead=None, eir=None):
+        '''
+        Calculate the LGD vector, reusing the ``ead`` and ``eir`` vectors if already computed.
+        '''
+        ead = self.exposure_at_default[account] if ead is None else ead
+        eir = self.effecive_interest_rate[account] if eir is None else eir
+        ci = take(self.index, account.remaining_life_index, offset=self.time_to_sale) / self.index[account.reporting_date]
         df = (1 + eir) ** -self.time_to_sale
 
         lgd = (
@@ -88,6 +93,9 @@ class UnsecuredLossGivenDefault:
         self.loss_given_write_off = loss_given_write_off
 
     def __getitem__(self, account: Account):
+        return self.values(account)
+
+    def values(self, account: Account, ead=None, eir=None):
         return Series(
              self.probability_of_cure * self.loss_given_cuve +
              (1 - self.probability_of_cure) * self.loss_given_write_off,
@@ -109,6 +117,9 @@ class ConstantLossGivenDefault:
         self.loss_given_default = loss_given_default
 
     def __getitem__(self, account: Account):
+        return self.values(account)
+
+    def values(self, account: Account, ead=None, eir=None):
         return Series(
             self.loss_given_default,
             index=account.remaining_life_index
@@ -141,8 +152,14 @@ class ConstantGrowthLossGivenDefault:
         self.growth_rate = growth_rate
 
     def __getitem__(self, account: Account):
-        ead = self.exposure_at_default[account]
-        eir = self.effecive_interest_rate[account]
+        return self.values(account)
+
+    def values(self, account: Account, ead=None, eir=None):
+        '''
+        Calculate the LGD vector, reusing the ``ead`` and ``eir`` vectors if already computed.
+        '''
+        ead = self.exposure_at_default[account] if ead is None else ead
+        eir = self.effecive_interest_rate[account] if eir is None else eir
         ci = (1 + self.growth_rate) ** ((self.time_to_sale + arange(account.remaining_life)) / 12)
         df = (1 + eir) ** -self.time_to_sale
 
@@ -179,8 +196,11 @@ class IndexedLossGivenDefault:
         self.index = index
 
     def __getitem__(self, account: Account):
+        return self.values(account)
+
+    def values(self, account: Account, ead=None, eir=None):
         return Series(
-            self.loss_given_default * self.index[account.remaining_life_index] / self.index[account.reporting_date],
+            self.loss_given_default * take(self.index, account.remaining_life_index) / self.index[account.reporting_date],
             index=account.remaining_life_index
         )
 
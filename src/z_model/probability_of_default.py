@@ -14,7 +14,7 @@ in the ECL calculation.
 Each PD model exposes a common API to calculate the account specific PD vector.
 
 '''
-from scipy.stats import norm as normal
+from scipy.special import ndtr, ndtri
 from numpy import array, repeat, stack, insert, append, cumprod, sum
 from pandas import Series, DataFrame
 from .scenarios import Scenario
@@ -65,8 +65,8 @@ class MertonVasicekProbabilityOfDefault:
         self.rho = rho
         self.frequency = frequency
         self.z_index = scenario.z_index
-        ttc = normal.ppf(1 - (1 - self.probability_of_default) ** (1 / self.frequency))
-        self.hazard = normal.cdf((ttc - self.z_index * (self.rho ** 0.5))/(1 - self.rho) ** 0.5)
+        ttc = ndtri(1 - (1 - self.probability_of_default) ** (1 / self.frequency))
+        self.hazard = ndtr((ttc - self.z_index * (self.rho ** 0.5))/(1 - self.rho) ** 0.5)
         self.surival = maximum(1 - self.hazard - (1 - (1 - self.redemption_rate) ** (1 / self.frequency)), 0)
 
     def __getitem__(self, account: Account):
@@ -91,11 +91,9 @@ class TransitionMatrixProbabilityOfDefault:
 
     def __getitem__(self, account: Account):
         # Calculate the probability of being in each risk grade excl. default (Survival probability)
-        s = stack(
-            self.transition_matrix.get_cumulative(
-                account.remaining_life_index,
-                return_list=True
-            )
+        s = self.transition_matrix.get_cumulative(
+            account.remaining_life_index,
+            return_list=True
         )[:, account.current_rating, :self.default_state]
         # Calculate the 1m transition to default probability
         h = stack(self.transition_matrix[account.remaining_life_index])[:, :self.default_state, self.default_state]
@@ -113,16 +113,28 @@ class Results:
 
     def save(self, url: Path):
         '''
-        Save the results and reports to a zip archive.
+        Save the results and reports.
 
-        :param url: the path to a Zip archive.
+        A ``.zip`` path produces the original archive of CSV reports. A path without an
+        extension is treated as a directory and the reports are written as parquet files
+        instead, which are columnar, compressed and much faster to write and load back than
+        CSV. Parquet output requires the ``parquet`` extra (``pip install Z-model[parquet]``).
+
+        :param url: the path to a Zip archive, or to a directory for parquet output.
 
         '''
-        if guess_extension(url) != '.zip':
-            raise ValueError(f'The file path {url} is not a .zip file.')
-
-        with ZipFile(url, mode="w", compression=ZIP_DEFLATED, compresslevel=9) as zf:
-            zf.writestr("detailed-result.csv", self.data.to_csv(index=False))
-            zf.writestr("reporting-date-result.csv", self.reporting_rate_results().to_csv(index=False))
-            zf.writestr("summary.csv", self.summarise().to_csv(index=False))
-            zf.writestr("parameters.csv", self.parameters().to_csv(index=False))
+        extension = guess_extension(url)
+        if extension == '.zip':
+            with ZipFile(url, mode="w", compression=ZIP_DEFLATED, compresslevel=9) as zf:
+                zf.writestr("detailed-result.csv", self.data.to_csv(index=False))
+                zf.writestr("reporting-date-result.csv", self.reporting_rate_results().to_csv(index=False))
+                zf.writestr("summary.csv", self.summarise().to_csv(index=False))
+                zf.writestr("parameters.csv", self.parameters().to_csv(index=False))
+        elif extension == '':
+            url.mkdir(parents=True, exist_ok=True)
+            self.data.to_parquet(url / 'detailed-result.parquet', index=False)
+            self.reporting_rate_results().to_parquet(url / 'reporting-date-result.parquet', index=False)
+            self.summarise().to_parquet(url / 'summary.parquet', index=False)
+            self.parameters().to_parquet(url / 'parameters.parquet', index=False)
+        else:
+            raise ValueError(f'The file path {url} is not a .zip file or a directory.')
@@ -1,10 +1,31 @@
-from pandas import read_excel, concat, DataFrame, date_range, merge, ExcelWriter
+from pandas import read_excel, concat, DataFrame, date_range, merge, ExcelWriter, read_pickle, to_pickle
 from numpy import exp
 from functools import reduce
 from datetime import datetime
 from pathlib import Path
 from .series import Series
-from .file_reader import read_file
+from .file_reader import read_file, guess_extension
+
+def take(x, index, offset: int = 0):
+    '''
+    Look up the values of the monthly time-series ``x`` at the dates in ``index``.
+
+    Scenario time-series are contiguous month-end series, so a label based lookup can be
+    replaced by an integer month-offset slice into the underlying array, avoiding the
+    per-date hashing done by the pandas index. If the requested dates (shifted forward by
+    ``offset`` months) fall outside the series the slower label based lookup is used.
+
+    :param x: a :class:`pandas.Series` with a monthly :class:`DatetimeIndex`.
+    :param index: the date index to look up.
+    :param offset: the number of months to shift the lookup forward (Default: 0).
+    '''
+    start = x.index[0]
+    i = (index[0].year - start.year) * 12 + (index[0].month - start.month) + offset
+    j = i + len(index)
+    if 0 <= i and j <= len(x):
+        return x.values[i:j]
+    return (x.shift(-offset) if offset else x)[index].values
+
 
 class Scenario:
     """
@@ -53,6 +74,25 @@ class Scenarios:
     def weights(self):
         return {n:s.weight for n, s in self.items()}
 
+    def plot(self, item: str):
+        """
+        Plot a single variable across all scenarios.
+
+        Matplotlib is imported inside the method so the (heavy) plotting stack is only
+        loaded when a plot is actually drawn, keeping model runs and worker processes free
+        of it.
+
+        :param item: the name of the variable to plot.
+        """
+        from matplotlib import pyplot
+        for name, scenario in self.items():
+            pyplot.plot(scenario.data.index, scenario[item], label=name)
+        pyplot.xlabel('DATE')
+        pyplot.ylabel(item)
+        if len(self) <= 10:
+            pyplot.legend()
+        pyplot.show()
+
     @classmethod
     def from_dataframe(cls, data: DataFrame, weights: dict):
         """
@@ -74,7 +114,17 @@ class Scenarios:
                     'VAR_2': float,
                     ...
                 }
+
+        The parsed scenarios are cached in a sibling ``.pkl`` file, which is used on
+        subsequent runs if it is newer than the source file.
         """
+        cache = url.with_suffix('.pkl')
+        if guess_extension(url) != '.pkl' and cache.exists() and cache.stat().st_mtime >= url.stat().st_mtime:
+            try:
+                return read_pickle(cache)
+            except Exception:
+                pass # a corrupt or stale cache (e.g. written by an older version) just means re-parsing
+
         data = read_file(
             url=url,
             sheet_name='DATA',
@@ -95,7 +145,12 @@ class Scenarios:
             index_col='SCENARIO'
         ).to_dict().get('WEIGHT')
 
-        return cls.from_dataframe(data, weights)
+        rs = cls.from_dataframe(data, weights)
+        try:
+            to_pickle(rs, cache)
+        except OSError:
+            pass # the cache is an optimisation only; a read-only location is not an error
+        return rs
 
     def to_file(self, url: Path):
         data = self.as_dataframe()
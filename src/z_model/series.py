@@ -1,4 +1,5 @@
-from numpy import empty, random, sqrt
+from numpy import empty, sqrt, float32
+from numpy.random import default_rng
 
 
 class Series:
@@ -16,7 +17,7 @@ class Series:
     * ``sigma`` is the volatility, and
     * ``dw`` is a Brownian motion.
     '''
-    def __init__(self, T: float, N: int, x0: float = None, dx0:float=.0, theta:float=.0, m1:float=.0, m2:float=.0, sigma:float=.0, m:int=1, fun=lambda x: x):
+    def __init__(self, T: float, N: int, x0: float = None, dx0:float=.0, theta:float=.0, m1:float=.0, m2:float=.0, sigma:float=.0, m:int=1, fun=lambda x: x, rng=None):
         '''
 
         :param NAME: str - The name of the macroeconomic variable that should be generated. It should match
@@ -50,6 +51,9 @@ class Series:
             supported at the moment and can be used to convert a variable that was modelled in the Log space to
             the nominal space.
 
+        :param rng: numpy.random.Generator - The random number generator used to create the Brownian motion.
+            Pass a seeded generator for reproducible simulations (Default: ``default_rng()``).
+
         '''
         self.T = T
         self.N = N
@@ -61,6 +65,7 @@ class Series:
         self.sigma = sigma
         self.m = m
         self.fun = fun
+        self.rng = default_rng() if rng is None else rng
         self.dt = T / N
         self.dx, self.x, self.fx = self._forecast()
 
@@ -68,12 +73,18 @@ class Series:
         return self.__dict__[item]
 
     def _forecast(self):
-        x = empty((self.m, self.N+1)); x[:, 0] = self.x0
-        dx = empty((self.m, self.N+1)); dx[:, 0] = self.dx0
-        dw = random.normal(scale=sqrt(self.dt), size=(self.m, self.N))
-
+        # Simulated scenario paths don't need float64 precision; float32 halves the memory
+        # traffic of the simulation and of every downstream lookup on the forecast.
+        x = empty((self.m, self.N+1), dtype=float32); x[:, 0] = self.x0
+        dx = empty((self.m, self.N+1), dtype=float32); dx[:, 0] = self.dx0
+        dw = self.rng.standard_normal(size=(self.m, self.N), dtype=float32) * sqrt(self.dt)
+
+        # The recurrence can't be vectorised over time (each step depends on the previous),
+        # but it is already vectorised over the simulation paths. Hoist the loop invariant
+        # parameters to locals so the per-step interpreter overhead stays minimal.
+        m1dt, theta, m2, sigma = self.m1 * self.dt, self.theta, self.m2, self.sigma
         for i in range(self.N):
-            dx[:, i+1] = self.m1 * (self.theta-x[:, i]) * self.dt + self.m2 * dx[:, i] + self.sigma * dw[:, i]
+            dx[:, i+1] = m1dt * (theta-x[:, i]) + m2 * dx[:, i] + sigma * dw[:, i]
             x[:, i + 1] = x[:, i] + dx[:, i+1]
 
         return dx, x, self.fun(x)
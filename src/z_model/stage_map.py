@@ -29,12 +29,18 @@ class StageMap:
         })
 
     @classmethod
-    def from_file(cls, url: Path, sheet_name = 'STAGE_MAP'):
+    def from_file(cls, url, sheet_name = 'STAGE_MAP'):
+        '''
+        Create a :class:`StageMap` from an Excel file.
+
+        :param url: path to the Excel file, or an already opened :class:`pandas.ExcelFile`
+            so the workbook does not have to be parsed again.
+        :param sheet_name: the sheet containing the stage map (Default: ``STAGE_MAP``).
+        '''
         stage_map = read_excel(
             io=url,
             sheet_name=sheet_name,
             dtype={'origination/current': str},
-            index_col='origination/current',
-            engine='openpyxl'
+            index_col='origination/current'
         )
         return cls.from_dataframe(stage_map)
@@ -1,6 +1,5 @@
 from numpy import array, zeros, sum, stack, insert
 from pandas import notna, Series, Index, DataFrame
-from dateutil.relativedelta import relativedelta
 from .account import Account
 from .transition_matrix import TransitionMatrix
 from .stage_map import StageMap
@@ -13,11 +12,14 @@ class StageProbability:
 
     def get_stage_probabilities(self, idx:Index ,origination_rating: int, current_rating:int):
         n_periods, (n_ratings, _) = self.transition_matrix.shape
-        template = zeros(shape=(len(idx), 4))
         origination_stage_map = self.stage_map[origination_rating]
-        cumulative_probabilities = stack(self.transition_matrix.get_cumulative(idx, return_list=True))[:, current_rating, :]
+        # Summing the rating columns per stage is a linear map, so fold the stage map into an
+        # indicator matrix and collapse the per-stage loop into a single matrix product.
+        indicator = zeros(shape=(n_ratings, 4))
         for stage in range(4):
-            template[:, stage] = sum(cumulative_probabilities[:, origination_stage_map[stage]], axis=1)
+            indicator[origination_stage_map[stage], stage] = 1
+        cumulative_probabilities = self.transition_matrix.get_cumulative(idx, return_list=True)[:, current_rating, :]
+        template = cumulative_probabilities @ indicator
 
         stage_probabilities = DataFrame(template, columns=[1, 2, 3, 'wo'])[:len(idx)]
         stage_probabilities.set_index(idx, inplace=True)
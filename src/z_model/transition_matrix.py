@@ -1,11 +1,11 @@
-from functools import reduce
+from functools import reduce, lru_cache
 from operator import __matmul__
 
 from numpy import array, sum, abs, cumsum, newaxis, diff, expand_dims, append, identity, stack, add, tile, flip, \
-    subtract, inf, dot, diag, log, exp, fill_diagonal, average, zeros
+    subtract, inf, dot, diag, log, exp, fill_diagonal, average, zeros, float32, frombuffer
 from numpy.linalg import eig, inv
 from pandas import Series, DataFrame
-from scipy.stats import norm as normal
+from scipy.special import ndtr, ndtri
 
 
 def logM(x):
@@ -87,20 +87,29 @@ def add_write_off(x: array, pcure: float, cure_state: int, time_to_sale: int):
 
     p = zeros((x.shape[0] + 1, x.shape[1] + 1)) # Expand the transition matrix to include a write-off state
     p[:-1, :-1] = x # initialise all exisiting probabilities
-    p[-2, -2] = 0 # set the 1m survival probability (adjusted later)
-    p[-2, cure_state] = p[-2, cure_state] + c # set the 1m cure probability
-    p[-2, -2] = p[-2, -2] + s # set the 1m survival probability
-    p[-2, -1] = p[-2, -1] + w # set the 1m write-off probability
+    p[-2, cure_state] += c # set the 1m cure probability
+    p[-2, -2] = s # set the 1m survival probability
+    p[-2, -1] = w # set the 1m write-off probability
     p[-1, -1] = 1 # write-off as the absorbing state
     return p
 
 
-def make_monthly_matrix(x: array, frequency: int, pcure: float, cure_state: int, time_to_sale:int):
-    '''Transform the transition matrix into a 1m transition matrix using the WA regularisation method, and include the write-off and cure'''
-    p = expM(gmWA(x, frequency))
+@lru_cache(maxsize=32)
+def _make_monthly_matrix(x_bytes: bytes, shape: tuple, frequency: int, pcure: float, cure_state: int, time_to_sale: int):
+    p = expM(gmWA(frombuffer(x_bytes).reshape(shape), frequency))
     return add_write_off(p, pcure, cure_state, time_to_sale)
 
 
+def make_monthly_matrix(x: array, frequency: int, pcure: float, cure_state: int, time_to_sale:int):
+    '''Transform the transition matrix into a 1m transition matrix using the WA regularisation method, and include the write-off and cure
+
+    The regularisation only depends on the segment assumptions, not the scenario, so the
+    result is cached and shared between the per-scenario model builds. A copy is returned
+    since callers standardise the matrix in place.
+    '''
+    return _make_monthly_matrix(x.astype(float).tobytes(), x.shape, frequency, pcure, cure_state, time_to_sale).copy()
+
+
 class TransitionMatrix:
     '''Transition Matrix
 
@@ -111,6 +120,7 @@ class TransitionMatrix:
         self.x = x
         self.shape = (len(x), x[0].shape)
         self.default_state = default_state
+        self._cumulative_cache = {}
 
     def __len__(self):
         return len(self.x)
@@ -130,25 +140,24 @@ class TransitionMatrix:
         '''
         Get the cumulative probability matrix as the product of the marginal matrixes
 
+        The result is cached on the matrix, keyed by the date index, since all accounts with
+        the same reporting date and remaining life share the same cumulative matrixes.
+
         :param idx: the index of the marginal transition matrixes to use.
-        :param return_list: should all cumulative matrixes be returned (True) on only the last cumulative matrix (Default: False).
+        :param return_list: should all cumulative matrixes be returned (True), as a single
+            stacked ``(T, n, n)`` array, or only the last cumulative matrix (Default: False).
         '''
-        i = expand_dims(identity(self.shape[-1][0]), axis=0)
+        key = (idx[0], idx[-1], len(idx), return_list)
+        if key in self._cumulative_cache:
+            return self._cumulative_cache[key]
+
+        i = expand_dims(identity(self.shape[-1][0], dtype=self.x[0].dtype), axis=0)
         x = append(i, stack(self[idx].values)[:-1], axis=0)
 
-        if return_list:
-            return Series(
-                self.matrix_cumulative_prod(
-                    x,
-                    return_list=True
-                ),
-                index=idx
-            )
-        else:
-            return self.matrix_cumulative_prod(
-                x,
-                return_list=False
-            )
+        cumulative = self.matrix_cumulative_prod(x, return_list=return_list)
+
+        self._cumulative_cache[key] = cumulative
+        return cumulative
 
 
     @staticmethod
@@ -156,13 +165,27 @@ class TransitionMatrix:
         '''
         Calculate the cumulative product of a list of matrixes
 
+        The cumulative products are calculated with a doubling prefix scan: at step ``d`` every
+        prefix is combined with the prefix ``d`` positions earlier via one batched matrix
+        multiply, so only ``log2(T)`` passes over the stack are made instead of ``T``
+        sequential products in Python.
+
         :param l: the list of matrixes to multiply
-        :param return_list: should intermediate products be returned (True) or only the last matrix (Default: False)
+        :param return_list: should intermediate products be returned (True), stacked into one
+            ``(T, n, n)`` array, or only the last matrix (Default: False)
         '''
         if return_list:
-            return reduce(lambda a, x: a + [a[-1] @ x] if a else [x], l, [])
+            x = stack(l)
+            d = 1
+            while d < len(x):
+                x[d:] = x[:-d] @ x[d:]
+                d *= 2
+            return x
         else:
-            return reduce(lambda a, x: a @ x if len(a) > 0 else x, l)
+            out = l[0]
+            for m in l[1:]:
+                out = out @ m
+            return out
 
     def get_m_step_probabilities(self, to_state: int, m: int = 12):
         '''
@@ -205,18 +228,18 @@ class TransitionMatrix:
             cttc[cttc > 1] = 1 # Fix any rounding > 100% to be exactly 100%
             cttc[cttc < 0] = 0 # Fix any rounding < 0% to be exactly 0%
 
-            default_distance = normal.ppf(cttc) # Calculate the TTC default distance
+            default_distance = ndtri(cttc) # Calculate the TTC default distance
             if calibrated:
-                pit = -diff(normal.cdf((default_distance - zt * rho ** 0.5)), append=0) # Calculate the expected PiT PD
+                pit = -diff(ndtr((default_distance - zt * rho ** 0.5)), append=0) # Calculate the expected PiT PD
             else:
-                pit = -diff(normal.cdf((default_distance - zt * rho ** 0.5) / (1 - rho) ** 0.5), append=0) # Calculate the conditional PiT PD
+                pit = -diff(ndtr((default_distance - zt * rho ** 0.5) / (1 - rho) ** 0.5), append=0) # Calculate the conditional PiT PD
 
         elif method.upper() == 'METHOD-2':
             cttc = flip(cumsum(flip(ttc, axis=1), axis=1), axis=1) # Calculate the cumulative TTC TM
             cttc[cttc > 1] = 1 # Fix any rounding > 100% to be exactly 100%
             cttc[cttc < 0] = 0 # Fix any rounding < 0% to be exactly 0%
 
-            B = -normal.ppf(cttc) # Calculate the TTC Default Barrier matrix
+            B = -ndtri(cttc) # Calculate the TTC Default Barrier matrix
             DD = tile(B[:, default_state, newaxis], ttc.shape[-1]) # Calculate the TTC Distance to Default matrix
 
             if calibrated:
@@ -225,9 +248,11 @@ class TransitionMatrix:
                 pit_dd = ((DD + zt * rho ** 0.5) / (1 - rho) ** 0.5) # Calculate the conditional PiT DD
 
             BS = tile(subtract(B, DD, out=B, where=abs(B) != inf), (len(z), 1, 1)) # Calculate the adjusted Z adjusted default barrier matrix
-            pit = diff(normal.cdf(add(BS, pit_dd, out=BS, where=abs(BS) != inf)), append=1) # Calculate the PiT PD (either expected on conditional)
+            pit = diff(ndtr(add(BS, pit_dd, out=BS, where=abs(BS) != inf)), append=1) # Calculate the PiT PD (either expected on conditional)
 
         else:
             raise ValueError(f'Method not supported: {method}')
 
-        return cls(Series(list(pit), index=z.index), default_state)
+        # Probabilities carry well below float64 precision; float32 halves the bytes moved by
+        # every downstream matrix product.
+        return cls(Series(list(pit.astype(float32)), index=z.index), default_state)